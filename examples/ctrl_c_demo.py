@@ -3,7 +3,7 @@
 Demo script to manually test Ctrl-C cancellation.
 
 Usage:
-  python test_ctrl_c_demo.py
+  python examples/ctrl_c_demo.py
 
 Then:
   1. Type a message and press Alt+Enter
@@ -12,6 +12,11 @@ Then:
 """
 
 import asyncio
+import sys
+from pathlib import Path
+
+# Add repl_toolkit to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from repl_toolkit import AsyncREPL
 
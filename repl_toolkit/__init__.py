@@ -39,27 +39,63 @@ logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __version__ = "2.3.0"
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .actions import Action, ActionContext, ActionRegistry
-from .async_repl import AsyncREPL, run_async_repl
-from .completion import PrefixCompleter, ShellExpansionCompleter
-from .formatting import (
-    auto_format,
-    create_auto_printer,
-    detect_format_type,
-    print_auto_formatted,
-    print_formatted_text,
-)
 from .headless_repl import HeadlessREPL, run_headless_mode
 from .images import (
     ImageData,
     ParsedContent,
     detect_media_type,
+    detect_media_type_many,
+    has_image_references,
     iter_content_parts,
     parse_image_references,
     reconstruct_message,
 )
 from .ptypes import ActionHandler, AsyncBackend, CancellableBackend, Completer
 
+if TYPE_CHECKING:
+    # Type checkers and IDEs see the real objects; at runtime these stay lazy
+    from .async_repl import AsyncREPL, run_async_repl
+    from .completion import PrefixCompleter, ShellExpansionCompleter
+    from .formatting import (
+        auto_format,
+        create_auto_printer,
+        detect_format_type,
+        print_auto_formatted,
+        print_formatted_text,
+    )
+
+# Exports that depend on prompt_toolkit, imported on first access so that
+# headless use of the package does not pay for loading it
+_LAZY_EXPORTS = {
+    "AsyncREPL": ".async_repl",
+    "run_async_repl": ".async_repl",
+    "PrefixCompleter": ".completion",
+    "ShellExpansionCompleter": ".completion",
+    "auto_format": ".formatting",
+    "create_auto_printer": ".formatting",
+    "detect_format_type": ".formatting",
+    "print_auto_formatted": ".formatting",
+    "print_formatted_text": ".formatting",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     # Core REPL
     "AsyncREPL",
@@ -83,6 +119,8 @@ __all__ = [
     "ImageData",
     "ParsedContent",
     "detect_media_type",
+    "detect_media_type_many",
+    "has_image_references",
     "parse_image_references",
     "iter_content_parts",
     "reconstruct_message",
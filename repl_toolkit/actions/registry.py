@@ -7,13 +7,17 @@ executing actions that can be triggered through multiple interaction methods.
 
 import importlib
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 from ..ptypes import ActionHandler, AsyncBackend
 from .action import Action, ActionContext, ActionError, ActionExecutionError, ActionValidationError
 
+# Column layouts for the help listings, bound once
+_HELP_LINE_FMT = "  {:<20}{:<15}{}".format
+_SHORTCUT_LINE_FMT = "  {:<15} {}".format
+
 
 class ActionRegistry(ActionHandler):
     """
@@ -69,7 +73,9 @@ class ActionRegistry(ActionHandler):
         self.actions: Dict[str, Action] = {}
         self.command_map: Dict[str, str] = {}  # command -> action_name
         self.key_map: Dict[str, str] = {}  # key_combo -> action_name
-        self.handler_cache: Dict[str, Callable] = {}
+        self.handler_cache: Dict[str, Callable] = {}  # import path -> resolved handler
+        self._help_line_cache: Dict[str, str] = {}  # action_name -> general help line
+        self._sorted_categories: Optional[List[Tuple[str, List[Action]]]] = None
         self._backend = None
         self.printer = printer
         # Register built-in actions
@@ -172,22 +178,24 @@ class ActionRegistry(ActionHandler):
                 f"Action '{action.name}' already exists"
             )  # pragma: no cover
 
-        if action.command and action.command in self.command_map:
-            existing_action = self.command_map[action.command]
+        existing_action = self.command_map.get(action.command) if action.command else None
+        if existing_action is not None:
             raise ActionValidationError(  # pragma: no cover
                 f"Command '{action.command}' already bound to action '{existing_action}'"
             )
 
         # Check for key conflicts
         for key_combo in action.get_keys_list():
-            if key_combo in self.key_map:
-                existing_action = self.key_map[key_combo]
+            existing_action = self.key_map.get(key_combo)
+            if existing_action is not None:
                 raise ActionValidationError(  # pragma: no cover
                     f"Key '{key_combo}' already bound to action '{existing_action}'"
                 )
 
         # Register action
         self.actions[action.name] = action
+        self._help_line_cache.pop(action.name, None)
+        self._sorted_categories = None
 
         # Register command mapping
         if action.command:
@@ -202,6 +210,11 @@ class ActionRegistry(ActionHandler):
         )
         logger.debug("ActionRegistry.register_action() exit")
 
+    @staticmethod
+    def _canon(command: str) -> str:
+        """Return command in canonical form, with a leading '/'."""
+        return command if command[:1] == "/" else "/" + command
+
     def get_action(self, name: str) -> Optional[Action]:
         """Get an action by name."""
         logger.debug("ActionRegistry.get_action() entry")
@@ -241,25 +254,23 @@ class ActionRegistry(ActionHandler):
             logger.debug("ActionRegistry._resolve_handler() exit - None handler")
             return None
 
-        # Check cache first
-        cache_key = f"{action.name}:{action.handler}"
-        if cache_key in self.handler_cache:
-            logger.debug("ActionRegistry._resolve_handler() exit - cached")
-            return self.handler_cache[cache_key]
-
-        # If already callable, use it
+        # If already callable, use it (nothing to resolve or cache)
         if callable(action.handler):
-            self.handler_cache[cache_key] = action.handler
             logger.debug("ActionRegistry._resolve_handler() exit - callable")
             return action.handler
 
-        # If string, try to import
+        # If string, import once and cache by import path
         if isinstance(action.handler, str):
+            cached = self.handler_cache.get(action.handler)
+            if cached is not None:
+                logger.debug("ActionRegistry._resolve_handler() exit - cached")
+                return cached
+
             try:
                 module_path, func_name = action.handler.rsplit(".", 1)
                 module = importlib.import_module(module_path)
                 handler_func = getattr(module, func_name)
-                self.handler_cache[cache_key] = handler_func
+                self.handler_cache[action.handler] = handler_func
                 logger.debug("ActionRegistry._resolve_handler() exit - imported")
                 return handler_func
             except Exception as e:  # pragma: no cover
@@ -287,12 +298,12 @@ class ActionRegistry(ActionHandler):
         """
         logger.debug("ActionRegistry.execute_action() entry")
 
-        action = self.get_action(action_name)
-        if not action:
+        action = self.actions.get(action_name)
+        if action is None:
             raise ActionError(f"Action '{action_name}' not found")  # pragma: no cover
 
         if not action.enabled:
-            logger.debug(f"Action '{action_name}' is disabled")
+            logger.debug("Action '%s' is disabled", action_name)
             logger.debug("ActionRegistry.execute_action() exit - disabled")
             return
 
@@ -300,12 +311,12 @@ class ActionRegistry(ActionHandler):
         handler = self._resolve_handler(action)
         if handler is None:
             # Main loop actions (like exit/quit) return without execution
-            logger.debug(f"Action '{action_name}' handled by main loop")
+            logger.debug("Action '%s' handled by main loop", action_name)
             logger.debug("ActionRegistry.execute_action() exit - main loop")
             return
 
         try:
-            logger.debug(f"Executing action '{action_name}' via {context.triggered_by}")
+            logger.debug("Executing action '%s' via %s", action_name, context.triggered_by)
 
             # Execute handler synchronously
             # If handler needs async operations, it can handle them internally
@@ -327,29 +338,26 @@ class ActionRegistry(ActionHandler):
             command_string: Full command string (e.g., '/help topic')
         """
         logger.debug("ActionRegistry.handle_command() entry")
-        logger.debug(f"Handling command: {command_string}")
+        logger.debug("Handling command: %s", command_string)
 
-        # Parse command and arguments
-        parts = command_string.strip().split()
+        # Split off the command only; arguments are tokenized once the action is known
+        parts = command_string.strip().split(None, 1)
         if not parts:
             logger.debug("ActionRegistry.handle_command() exit - no parts")
             return
 
-        command = parts[0]
-        args = parts[1:]
+        command = self._canon(parts[0])
 
-        # Ensure command starts with /
-        if not command.startswith("/"):
-            command = f"/{command}"
-
-        # Look up action
-        action = self.get_action_by_command(command)
-        if not action:
+        # One dict probe: execute_action() resolves the name to its Action
+        action_name = self.command_map.get(command)
+        if action_name is None:
             self.printer(f"Unknown command: {command}")
             self.printer("Use /help to see available commands.")
             logger.debug("ActionRegistry.handle_command() exit - unknown command")
             return
 
+        args = parts[1].split() if len(parts) > 1 else []
+
         # Create context and execute
         context = ActionContext(
             registry=self,
@@ -363,7 +371,7 @@ class ActionRegistry(ActionHandler):
         vars(context).update(kwargs)
 
         try:
-            self.execute_action(action.name, context)
+            self.execute_action(action_name, context)
             logger.debug("ActionRegistry.handle_command() exit - success")
         except ActionError as e:  # pragma: no cover
             logger.warning(f"Action error in command '{command_string}': {e}")
@@ -381,12 +389,11 @@ class ActionRegistry(ActionHandler):
             event: Key press event from prompt_toolkit
         """
         logger.debug("ActionRegistry.handle_shortcut() entry")
-        logger.debug(f"Handling shortcut: {key_combo}")
+        logger.debug("Handling shortcut: %s", key_combo)
 
-        # Look up action
-        action = self.get_action_by_keys(key_combo)
-        if not action:
-            logger.debug(f"No action bound to key combination: {key_combo}")
+        action_name = self.key_map.get(key_combo)
+        if action_name is None:
+            logger.debug("No action bound to key combination: %s", key_combo)
             logger.debug("ActionRegistry.handle_shortcut() exit - no action")
             return
 
@@ -402,7 +409,7 @@ class ActionRegistry(ActionHandler):
         vars(context).update(kwargs)
 
         try:
-            self.execute_action(action.name, context)
+            self.execute_action(action_name, context)
             logger.debug("ActionRegistry.handle_shortcut() exit - success")
         except ActionError as e:  # pragma: no cover
             logger.warning(f"Action error in shortcut '{key_combo}': {e}")
@@ -469,7 +476,7 @@ class ActionRegistry(ActionHandler):
             command = text[:space_pos]
 
         result = command in self.command_map
-        logger.debug(f"ActionRegistry.is_registered_command() exit - {result}")
+        logger.debug("ActionRegistry.is_registered_command() exit - %s", result)
         return result
 
     def get_actions_by_category(self) -> Dict[str, List[Action]]:
@@ -485,6 +492,15 @@ class ActionRegistry(ActionHandler):
         logger.debug("ActionRegistry.get_actions_by_category() exit")
         return categories
 
+    def _get_sorted_categories(self) -> List[Tuple[str, List[Action]]]:
+        """Get (category, actions) pairs sorted for help output, built once per registration."""
+        if self._sorted_categories is None:
+            self._sorted_categories = [
+                (category, sorted(actions, key=lambda a: a.name))
+                for category, actions in sorted(self.get_actions_by_category().items())
+            ]
+        return self._sorted_categories
+
     # Built-in action handlers
     def _show_help(self, context: ActionContext) -> None:
         """Show help information."""
@@ -498,9 +514,7 @@ class ActionRegistry(ActionHandler):
             action = self.get_action(target)
             if not action:
                 # Try as command (add / if missing)
-                if not target.startswith("/"):
-                    target = f"/{target}"
-                action = self.get_action_by_command(target)
+                action = self.get_action_by_command(self._canon(target))
 
             if action:
                 self._show_action_help(action, context)
@@ -515,73 +529,69 @@ class ActionRegistry(ActionHandler):
     def _show_action_help(self, action: Action, context: ActionContext) -> None:
         """Show detailed help for a specific action."""
         logger.debug("ActionRegistry._show_action_help() entry")
-        context.printer(f"\n{action.description}")
-        context.printer(f"Category: {action.category}")
+        lines = [f"\n{action.description}", f"Category: {action.category}"]
 
         if action.command:
-            context.printer(f"Command: {action.command_usage or action.command}")
+            lines.append(f"Command: {action.command_usage or action.command}")
 
         if action.keys:
             keys_str = ", ".join(action.get_keys_list())
             desc = f" - {action.keys_description}" if action.keys_description else ""
-            context.printer(f"Shortcut: {keys_str}{desc}")
+            lines.append(f"Shortcut: {keys_str}{desc}")
 
         if not action.enabled:
-            context.printer("Status: Disabled")
-        context.printer("")
+            lines.append("Status: Disabled")
+        lines.append("")
+
+        # One printer call per screen rather than per line
+        context.printer("\n".join(lines))
 
         logger.debug("ActionRegistry._show_action_help() exit")
 
     def _show_general_help(self, context: ActionContext) -> None:
         """Show general help with all actions organized by category."""
         logger.debug("ActionRegistry._show_general_help() entry")
-        context.printer("\nAvailable Actions:")
-        context.printer("=" * 50)
-
-        categories = self.get_actions_by_category()
-
-        for category, actions in sorted(categories.items()):
-            context.printer(f"\n{category}:")
-            for action in sorted(actions, key=lambda a: a.name):
-                # Format display line
-                parts = []
-
-                if action.command:
-                    parts.append(f"{action.command:<20}")
-                else:
-                    parts.append(" " * 20)
-
-                if action.keys:
-                    keys_str = ", ".join(action.get_keys_list())
-                    parts.append(f"{keys_str:<15}")
-                else:
-                    parts.append(" " * 15)
-
-                parts.append(action.description)
-                context.printer("  " + "".join(parts))
-        context.printer("\nUse '/help <command>' for detailed information about a specific action.")
-        context.printer("Use '/shortcuts' to see only keyboard shortcuts.")
-        context.printer("")
+        lines = ["\nAvailable Actions:", "=" * 50]
+
+        for category, actions in self._get_sorted_categories():
+            lines.append(f"\n{category}:")
+            for action in actions:
+                lines.append(self._get_help_line(action))
+        lines.append("\nUse '/help <command>' for detailed information about a specific action.")
+        lines.append("Use '/shortcuts' to see only keyboard shortcuts.")
+        lines.append("")
+
+        context.printer("\n".join(lines))
 
         logger.debug("ActionRegistry._show_general_help() exit")
 
+    def _get_help_line(self, action: Action) -> str:
+        """Get the general help line for an action, formatting it on first use."""
+        line = self._help_line_cache.get(action.name)
+        if line is None:
+            keys_str = ", ".join(action.get_keys_list()) if action.keys else ""
+            # Only the first line of a multi-line description fits the table
+            summary, _, _ = action.description.partition("\n")
+            line = _HELP_LINE_FMT(action.command or "", keys_str, summary)
+            self._help_line_cache[action.name] = line
+        return line
+
     def _list_shortcuts(self, context: ActionContext) -> None:
         """List all keyboard shortcuts."""
         logger.debug("ActionRegistry._list_shortcuts() entry")
-        context.printer("\nKeyboard Shortcuts:")
-        context.printer("=" * 50)
-
-        categories = self.get_actions_by_category()
+        lines = ["\nKeyboard Shortcuts:", "=" * 50]
 
-        for category, actions in sorted(categories.items()):
+        for category, actions in self._get_sorted_categories():
             shortcuts_in_category = [a for a in actions if a.keys]
             if not shortcuts_in_category:
                 continue
-            context.printer(f"\n{category}:")
-            for action in sorted(shortcuts_in_category, key=lambda a: a.name):
+            lines.append(f"\n{category}:")
+            for action in shortcuts_in_category:
                 keys_str = ", ".join(action.get_keys_list())
                 desc = action.keys_description or action.description
-                context.printer(f"  {keys_str:<15} {desc}")
-        context.printer("")
+                lines.append(_SHORTCUT_LINE_FMT(keys_str, desc))
+        lines.append("")
+
+        context.printer("\n".join(lines))
 
         logger.debug("ActionRegistry._list_shortcuts() exit")
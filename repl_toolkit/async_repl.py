@@ -9,11 +9,12 @@ Provides an interactive chat interface with:
 """
 
 import asyncio
+import functools
 import logging
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from prompt_toolkit import HTML, PromptSession
 from prompt_toolkit import print_formatted_text as print
@@ -32,7 +33,113 @@ from .ptypes import AsyncBackend, CancellableBackend
 
 logger = logging.getLogger(__name__)
 
-THINKING_MESSAGE = HTML("<i><grey>Thinking... (Press Ctrl+C or Alt+C to cancel)</grey></i>")
+_EXIT_COMMANDS = frozenset({"/exit", "/quit"})
+_EXIT_COMMAND_LENGTHS = frozenset(map(len, _EXIT_COMMANDS))
+
+_THINKING_MARKUP = "<i><grey>Thinking... (Press Ctrl+C or Alt+C to cancel)</grey></i>"
+
+
+@functools.lru_cache(maxsize=None)
+def _thinking_message() -> HTML:
+    """Parse the thinking indicator on first use rather than at import."""
+    return HTML(_THINKING_MARKUP)
+
+
+if TYPE_CHECKING:
+    THINKING_MESSAGE: HTML
+
+
+def __getattr__(name: str) -> Any:
+    # Keep the THINKING_MESSAGE module attribute without parsing it at import
+    if name == "THINKING_MESSAGE":
+        return _thinking_message()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _CoalescingPrinter:
+    """
+    Default AsyncREPL printer that merges the output of one action.
+
+    Every print_formatted_text() call while the prompt is active costs a
+    full erase and redraw of the prompt, so messages printed inside
+    batch() are held back and written with a single call when the
+    outermost batch ends. Outside a batch, messages are printed at once.
+    """
+
+    __slots__ = ("_pending", "_depth")
+
+    def __init__(self) -> None:
+        self._pending: List[Any] = []
+        self._depth = 0
+
+    def __call__(self, message: Any) -> None:
+        if self._depth:
+            self._pending.append(message)
+        else:
+            print_formatted_text(message)
+
+    @contextmanager
+    def batch(self):
+        """Collect messages until the outermost batch exits."""
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write any held-back messages in one call, in order."""
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+        if len(pending) == 1:
+            print_formatted_text(pending[0])
+        else:
+            print_formatted_text(*pending, sep="\n")
+
+
+# Common combinations resolved without going through the generic parser
+_STATIC_COMBOS = {
+    "alt-enter": (Keys.Escape, "enter"),
+    "ctrl-c": ("c-c",),
+    "ctrl-d": ("c-d",),
+    "ctrl-s": ("c-s",),
+    **{f"f{n}": (f"f{n}",) for n in range(1, 13)},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_key_combination_cached(key_combo: str) -> tuple:
+    """Parse key combination string into prompt_toolkit format (memoized)."""
+    key_combo = key_combo.lower().strip()
+
+    static = _STATIC_COMBOS.get(key_combo)
+    if static is not None:
+        return static
+
+    if key_combo.startswith("f") and key_combo[1:].isdigit():
+        return (key_combo,)
+
+    if "-" in key_combo:
+        parts = key_combo.split("-")
+        if len(parts) == 3:
+            return (key_combo,)
+        if len(parts) == 2:
+            modifier, key = parts
+            if modifier == "ctrl":
+                return ("c-" + key,)
+            elif modifier == "alt":
+                return (Keys.Escape, key)
+            elif modifier == "shift":
+                return ("s-" + key,)
+
+    return (key_combo,)
+
+
+_CANCEL_MESSAGE = "Operation cancelled by user"
 
 
 class AsyncREPL:
@@ -65,9 +172,13 @@ class AsyncREPL:
         self.prompt_string = HTML(prompt_string or "User: ")
         self._image_buffer: Dict[str, ImageData] = {}
         self._image_counter = 0
+        self._cancel_event: Optional[asyncio.Event] = None
+        self._cancel_event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cancel_armed = False
+        self._cancel_app: Optional[Application] = None
 
         if action_registry is None:
-            action_registry = ActionRegistry(printer=lambda msg: print_formatted_text(msg))
+            action_registry = ActionRegistry(printer=_CoalescingPrinter())
         self.action_registry = action_registry
 
         if enable_image_paste:
@@ -112,6 +223,12 @@ class AsyncREPL:
         """Get current image buffer."""
         return self._image_buffer.copy()
 
+    def _take_images(self) -> Dict[str, ImageData]:
+        """Detach the buffered images for the current turn, leaving an empty buffer."""
+        images = self._image_buffer
+        self._image_buffer = {}
+        return images
+
     # ─────────────────────────────────────────────────────────────────────────
     # Session Setup
     # ─────────────────────────────────────────────────────────────────────────
@@ -149,56 +266,49 @@ class AsyncREPL:
 
     def _register_action_shortcuts(self, bindings: KeyBindings) -> None:
         """Register keyboard shortcuts from the action registry."""
-        if not hasattr(self.action_registry, "key_map"):
+        key_map = getattr(self.action_registry, "key_map", None)
+        if not key_map:
             return
 
-        for key_combo, action_name in self.action_registry.key_map.items():
+        for key_combo, action_name in key_map.items():
             self._register_shortcut(bindings, key_combo, action_name)
 
     def _register_shortcut(self, bindings: KeyBindings, key_combo: str, action_name: str) -> None:
         """Register a single keyboard shortcut."""
         try:
             keys = self._parse_key_combination(key_combo)
+            registry = self.action_registry
+            execute_action = registry.execute_action
 
             @bindings.add(*keys)
             def handle_shortcut(event, action=action_name):
                 try:
                     context = ActionContext(
-                        registry=self.action_registry,
+                        registry=registry,
                         repl=self,
                         buffer=event.current_buffer,
-                        backend=getattr(self.action_registry, "backend", None),
+                        backend=getattr(registry, "backend", None),
                         event=event,
                         triggered_by="shortcut",
                     )
-                    self.action_registry.execute_action(action, context)
+                    with self._output_batch():
+                        execute_action(action, context)
                 except Exception:
                     logger.exception(f"Error executing shortcut '{key_combo}'")
 
         except Exception as e:
             logger.error(f"Failed to register shortcut '{key_combo}': {e}")
 
+    def _output_batch(self):
+        """Coalesce action output when the registry uses the default printer."""
+        printer = getattr(self.action_registry, "printer", None)
+        if isinstance(printer, _CoalescingPrinter):
+            return printer.batch()
+        return nullcontext()
+
     def _parse_key_combination(self, key_combo: str) -> tuple:
         """Parse key combination string into prompt_toolkit format."""
-        key_combo = key_combo.lower().strip()
-
-        if key_combo.startswith("f") and key_combo[1:].isdigit():
-            return (key_combo,)
-
-        if "-" in key_combo:
-            parts = key_combo.split("-")
-            if len(parts) == 3:
-                return (key_combo,)
-            if len(parts) == 2:
-                modifier, key = parts
-                if modifier == "ctrl":
-                    return ("c-" + key,)
-                elif modifier == "alt":
-                    return (Keys.Escape, key)
-                elif modifier == "shift":
-                    return ("s-" + key,)
-
-        return (key_combo,)
+        return _parse_key_combination_cached(key_combo)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Main REPL Loop
@@ -225,12 +335,16 @@ class AsyncREPL:
                 with patch_stdout():
                     user_input = await self.session.prompt_async()
 
-                if self._is_exit_command(user_input):
+                # Strip once; str.strip() on already-stripped text returns the same object
+                stripped = user_input.strip()
+                if self._is_exit_command(stripped):
                     break
-                if not user_input.strip():
+                if not stripped:
                     continue
-                if user_input.strip().startswith("/"):
-                    self.action_registry.handle_command(user_input.strip())
+                if stripped.startswith("/"):
+                    with self._output_batch():
+                        self.action_registry.handle_command(stripped)
+                    # Yield so work scheduled by the command runs before the next prompt
                     await asyncio.sleep(0)
                     continue
 
@@ -244,7 +358,12 @@ class AsyncREPL:
 
     def _is_exit_command(self, user_input: str) -> bool:
         """Check if input is an exit command."""
-        return user_input.strip().lower() in ["/exit", "/quit"]
+        # str.strip() returns the same object when there is nothing to strip, and
+        # the length check rejects ordinary input before lower() copies it
+        candidate = user_input.strip()
+        if len(candidate) not in _EXIT_COMMAND_LENGTHS:
+            return False
+        return candidate.lower() in _EXIT_COMMANDS
 
     # ─────────────────────────────────────────────────────────────────────────
     # Input Processing with Cancellation
@@ -257,20 +376,19 @@ class AsyncREPL:
         Runs the backend task concurrently with a cancellation listener,
         allowing users to cancel via Ctrl+C or Alt+C.
         """
+        # The backend owns this turn's images; they are released with the turn
+        # rather than cleared from under a backend that may still hold them.
+        images = self._take_images()
+
         async with self._cancellation_context() as ctx:
-            kwargs = self._build_backend_kwargs(ctx["trigger_cancel"])
+            kwargs = self._build_backend_kwargs(ctx["trigger_cancel"], images)
             backend_task = asyncio.create_task(backend.handle_input(user_input, **kwargs))
 
-            print(THINKING_MESSAGE)
+            print(_thinking_message())
 
-            done, _ = await asyncio.wait(
-                [backend_task, ctx["cancel_future"]],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            if ctx["cancel_future"] in done:
+            if await self._wait_for_turn(backend_task, ctx["cancel_event"]):
                 await self._handle_cancellation(backend_task, backend)
-            elif backend_task in done:
+            else:
                 try:
                     success = backend_task.result()
                     if not success:
@@ -280,74 +398,126 @@ class AsyncREPL:
                 except Exception:
                     logger.exception("Backend task raised exception")
 
+    async def _wait_for_turn(self, backend_task: asyncio.Task, cancel_event: asyncio.Event) -> bool:
+        """
+        Wait until the backend task finishes or cancellation is requested.
+
+        The helper task waiting on the cancel event is always cancelled and
+        awaited before returning, so no task outlives the turn.
+
+        Returns:
+            True if cancellation was requested, False if the backend finished first
+        """
+        cancel_wait = asyncio.create_task(cancel_event.wait())
+        try:
+            done, _ = await asyncio.wait(
+                [backend_task, cancel_wait],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            cancel_wait.cancel()
+            await asyncio.gather(cancel_wait, return_exceptions=True)
+        return cancel_wait in done
+
     @asynccontextmanager
     async def _cancellation_context(self):
         """
         Context manager for cancellation support.
 
-        Sets up the cancel future and cancellation key listener.
-        Yields a dict with cancel_future and trigger_cancel callback.
+        Re-arms the reusable cancel event and runs the cancellation key listener.
+        Yields a dict with cancel_event and trigger_cancel callback.
         """
-        loop = asyncio.get_event_loop()
-        cancel_future: asyncio.Future = asyncio.Future()
+        loop = asyncio.get_running_loop()
+        cancel_event = self._get_cancel_event()
+        cancel_event.clear()
         cancel_app: Optional[Application] = None
         listener_task: Optional[asyncio.Task] = None
+        turn_active = True
 
         def trigger_cancel():
             """Thread-safe callback to trigger cancellation."""
 
             def _set_cancel():
-                if not cancel_future.done():
-                    cancel_future.set_result(None)
+                # A callback kept past its turn must not cancel a later one
+                if turn_active:
+                    self._request_cancel()
 
             loop.call_soon_threadsafe(_set_cancel)
 
         try:
-            cancel_app = self._create_cancel_app(cancel_future)
+            self._cancel_armed = True
+            cancel_app = self._get_cancel_app()
             listener_task = asyncio.create_task(cancel_app.run_async())
 
             yield {
-                "cancel_future": cancel_future,
+                "cancel_event": cancel_event,
                 "trigger_cancel": trigger_cancel,
             }
 
         except KeyboardInterrupt:
-            if not cancel_future.done():
-                cancel_future.set_result(None)
+            self._request_cancel()
 
         except Exception:
             logger.exception("Error during input processing")
 
         finally:
-            self._image_buffer.clear()
-            await self._cleanup_cancel_context(cancel_app, listener_task)
-            self._reset_ui()
+            turn_active = False
+            self._cancel_armed = False
+            await self._finalize_turn(cancel_app, listener_task)
+
+    def _get_cancel_event(self) -> asyncio.Event:
+        """Return the reusable cancel event, recreated if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._cancel_event is None or self._cancel_event_loop is not loop:
+            self._cancel_event = asyncio.Event()
+            self._cancel_event_loop = loop
+        return self._cancel_event
+
+    def _request_cancel(self) -> None:
+        """Signal the turn in progress (if any) to cancel."""
+        cancel_event = self._cancel_event
+        if self._cancel_armed and cancel_event is not None:
+            cancel_event.set()
+
+    def _get_cancel_app(self) -> Application:
+        """Return the cancel listener application, creating it on first use."""
+        if self._cancel_app is None:
+            self._cancel_app = self._create_cancel_app()
+        return self._cancel_app
+
+    def _create_cancel_app(self) -> Application:
+        """
+        Create application that listens for Ctrl+C and Alt+C.
 
-    def _create_cancel_app(self, cancel_future: asyncio.Future) -> Application:
-        """Create application that listens for Ctrl+C and Alt+C."""
+        Built once per REPL and re-run for every turn; key presses signal
+        whichever turn is currently in progress.
+        """
         kb = KeyBindings()
 
-        @kb.add("escape", "c")
-        def handle_alt_c(event):
-            if not cancel_future.done():
-                cancel_future.set_result(None)
+        def _cancel(event) -> None:
+            # Plain exit (no exception) - the set cancel event is what tells
+            # _process_input that the turn was cancelled.
+            self._request_cancel()
             if not event.app.is_done:
                 event.app.exit()
 
+        @kb.add("escape", "c")
+        def handle_alt_c(event):
+            _cancel(event)
+
         @kb.add("c-c")
         def handle_ctrl_c(event):
-            if not cancel_future.done():
-                cancel_future.set_result(None)
-            if not event.app.is_done:
-                event.app.exit()
+            _cancel(event)
 
         return Application(key_bindings=kb, output=DummyOutput(), input=create_input())
 
-    def _build_backend_kwargs(self, trigger_cancel: Callable[[], None]) -> Dict[str, Any]:
+    def _build_backend_kwargs(
+        self, trigger_cancel: Callable[[], None], images: Dict[str, ImageData]
+    ) -> Dict[str, Any]:
         """Build kwargs dict for backend.handle_input()."""
         kwargs: Dict[str, Any] = {"cancel_callback": trigger_cancel}
-        if self._image_buffer:
-            kwargs["images"] = self._image_buffer
+        if images:
+            kwargs["images"] = images
         return kwargs
 
     async def _handle_cancellation(self, backend_task: asyncio.Task, backend: AsyncBackend) -> None:
@@ -358,7 +528,7 @@ class AsyncREPL:
         - True or None: Force-cancel the asyncio task (backward compatible default)
         - False: Wait for task to complete gracefully (allows cleanup hooks to fire)
         """
-        print("\nOperation cancelled by user.")
+        print(f"\n{_CANCEL_MESSAGE}.")
 
         # Default: force cancel (backward compatible with old backends)
         should_force_cancel = True
@@ -366,7 +536,7 @@ class AsyncREPL:
         # Signal cancellation to backend if it supports the protocol
         if isinstance(backend, CancellableBackend):
             try:
-                result = backend.cancel("Operation cancelled by user")
+                result = backend.cancel(_CANCEL_MESSAGE)
                 # Only False means "let me complete gracefully"
                 # True or None (legacy) means "force cancel"
                 if result is False:
@@ -394,31 +564,21 @@ class AsyncREPL:
             except Exception:
                 logger.exception("Backend task raised exception during cancellation")
 
-    async def _cleanup_cancel_context(
+    async def _finalize_turn(
         self, cancel_app: Optional[Application], listener_task: Optional[asyncio.Task]
     ) -> None:
-        """Cleanup the cancellation app and listener task."""
+        """Stop the cancellation listener and reset the UI after a turn."""
         try:
-            if cancel_app and not cancel_app.is_done:
+            if cancel_app and cancel_app.is_running and not cancel_app.is_done:
                 cancel_app.exit()
-
             if listener_task:
                 if not listener_task.done():
                     listener_task.cancel()
-                try:
-                    await listener_task
-                except (asyncio.CancelledError, KeyboardInterrupt, Exception):
-                    pass
-        except Exception:
-            pass
-
-    def _reset_ui(self) -> None:
-        """Reset the UI after processing."""
-        try:
+                await asyncio.gather(listener_task, return_exceptions=True)
             self.main_app.renderer.reset()
             self.main_app.invalidate()
-        except Exception:
-            pass
+        except Exception as e:
+            logger.debug("Error finalizing turn: %s", e)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1,4 +1,5 @@
 import asyncio
+import io
 import logging
 import sys
 from typing import Optional
@@ -25,8 +26,8 @@ class HeadlessREPL:
         """Initialize headless REPL."""
         logger.debug("HeadlessREPL.__init__() entry")
 
-        # Simple string buffer for content accumulation
-        self.buffer = ""
+        # Growing text buffer for content accumulation (exposed as `buffer`)
+        self._buffer_io = io.StringIO()
         self.action_registry = action_registry or ActionRegistry()
 
         # State tracking
@@ -37,6 +38,17 @@ class HeadlessREPL:
 
         logger.debug("HeadlessREPL.__init__() exit")
 
+    @property
+    def buffer(self) -> str:
+        """Content accumulated since the last send."""
+        return self._buffer_io.getvalue()
+
+    @buffer.setter
+    def buffer(self, value: str) -> None:
+        """Replace the accumulated content (assign "" to clear)."""
+        self._buffer_io = io.StringIO()
+        self._buffer_io.write(value)
+
     async def run(self, backend: AsyncBackend, initial_message: Optional[str] = None) -> bool:
         """
         Run headless mode with stdin processing.
@@ -60,9 +72,7 @@ class HeadlessREPL:
             # Process initial message if provided
             if initial_message:
                 logger.info(f"Processing initial message: {initial_message}")
-                success = await backend.handle_input(initial_message)
-                if not success:
-                    logger.warning("Initial message processing failed")
+                if not await self._safe_handle(backend, initial_message, "Initial message"):
                     self.total_success = False
 
             # Enter stdin processing loop
@@ -137,12 +147,12 @@ class HeadlessREPL:
         """
         logger.debug("HeadlessREPL._add_to_buffer() entry")
 
-        if self.buffer:
-            self.buffer += "\n" + line
-        else:
-            self.buffer = line
+        buffer_io = self._buffer_io
+        if buffer_io.tell():
+            buffer_io.write("\n")
+        buffer_io.write(line)
 
-        logger.debug(f"Added line to buffer, total length: {len(self.buffer)}")
+        logger.debug("Added line to buffer, total length: %d", buffer_io.tell())
         logger.debug("HeadlessREPL._add_to_buffer() exit")
 
     async def _execute_send(self, backend: AsyncBackend, context_info: str):
@@ -167,26 +177,39 @@ class HeadlessREPL:
             f"Send #{self.send_count} at {context_info}: sending {len(buffer_content)} characters"
         )
 
-        try:
-            # Send to backend and wait for completion
-            success = await backend.handle_input(buffer_content)
+        # Send to backend and wait for completion
+        if await self._safe_handle(backend, buffer_content, f"Send #{self.send_count}"):
+            logger.info(f"Send #{self.send_count} completed successfully")
+        else:
+            self.total_success = False
 
-            if success:
-                logger.info(f"Send #{self.send_count} completed successfully")
-            else:
-                logger.warning(f"Send #{self.send_count} completed with backend reporting failure")
-                self.total_success = False
+        # Clear buffer after send (successful, failed or raised)
+        self.buffer = ""
+        _flush_stdout()
+
+        logger.debug("HeadlessREPL._execute_send() exit")
 
-            # Clear buffer after send (successful or not)
-            self.buffer = ""
+    async def _safe_handle(self, backend: AsyncBackend, message: str, label: str) -> bool:
+        """
+        Send a message to the backend, converting exceptions into failure.
 
+        Args:
+            backend: Backend to send the message to
+            message: Message content
+            label: Description used in log messages (e.g., "Send #2")
+
+        Returns:
+            bool: True if the backend reported success, False otherwise
+        """
+        try:
+            success = await backend.handle_input(message)
         except Exception as e:
-            logger.error(f"Send #{self.send_count} failed with exception: {e}")
-            self.total_success = False
-            # Clear buffer even on exception to continue processing
-            self.buffer = ""
+            logger.error(f"{label} failed with exception: {e}")
+            return False
 
-        logger.debug("HeadlessREPL._execute_send() exit")
+        if not success:
+            logger.warning(f"{label} completed with backend reporting failure")
+        return bool(success)
 
     def _execute_command(self, command: str):
         """
@@ -204,6 +227,7 @@ class HeadlessREPL:
             logger.error(f"Error executing command '{command}': {e}")
             # Don't fail entire process for command errors
 
+        _flush_stdout()
         logger.debug("HeadlessREPL._execute_command() exit")
 
     async def _handle_eof(self, backend: AsyncBackend):
@@ -226,6 +250,24 @@ class HeadlessREPL:
         logger.debug("HeadlessREPL._handle_eof() exit")
 
 
+def _flush_stdout() -> None:
+    """
+    Push pending stdout output downstream.
+
+    A piped stdout is block-buffered, so without this a consumer would only
+    see command and backend output once several kilobytes had accumulated.
+    Flushing once per command or send keeps the writes themselves buffered.
+    """
+    stdout = sys.stdout
+    if stdout is None:
+        return
+    try:
+        stdout.flush()
+    except (OSError, ValueError):
+        # Closed or broken pipe - nothing useful to do from here
+        pass
+
+
 async def run_headless_mode(
     backend: AsyncBackend,
     action_registry: Optional[ActionHandler] = None,
@@ -37,7 +37,9 @@ text_with_data = reconstruct_message(parsed.text, images)
 
 - `create_paste_action()`: Register /paste command (auto-registered in AsyncREPL)
 - `parse_image_references()`: Extract image IDs from text
+- `has_image_references()`: Cheap check for any placeholder in text
 - `reconstruct_message()`: Replace placeholders with data
+- `detect_media_type()` / `detect_media_type_many()`: Identify image formats
 - `extract_clipboard_image()`: Get image from system clipboard
 
 ## Data Classes
@@ -46,9 +48,41 @@ text_with_data = reconstruct_message(parsed.text, images)
 - `ParsedContent`: Text + extracted image IDs + placeholders
 """
 
+import functools
 import re
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .actions import Action
+
+# Pre-compile the placeholder pattern once for all parsing calls. The ID length
+# is bounded (add_image() generates "img_NNN") to cap backtracking.
+_IMAGE_REF_PATTERN = re.compile(r"\{\{image:(\w{1,64})\}\}")
+
+# Shared read-only stand-in when no images are passed; only ever read via .get()
+_EMPTY_IMAGES: Dict[str, "ImageData"] = {}
+
+# Magic-byte signatures. WEBP is a RIFF container and is checked separately.
+_SIGNATURES: Tuple[Tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+
+def _build_first_byte_table() -> List[Optional[Tuple[Tuple[bytes, str], ...]]]:
+    """Index signatures by first byte; a list index is cheaper than a dict lookup."""
+    table: List[Optional[Tuple[Tuple[bytes, str], ...]]] = [None] * 256
+    for signature in _SIGNATURES:
+        first = signature[0][0]
+        table[first] = (table[first] or ()) + (signature,)
+    return table
+
+
+# Detection only tests the candidates whose first byte matches
+_FIRST_BYTE_TABLE = _build_first_byte_table()
 
 
 @dataclass
@@ -62,6 +96,9 @@ class ImageData:
         timestamp: When the image was captured
     """
 
+    # Explicit slots rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("data", "media_type", "timestamp")
+
     data: bytes
     media_type: str
     timestamp: float
@@ -78,17 +115,20 @@ class ParsedContent:
         image_ids: Set of unique image IDs referenced
     """
 
+    __slots__ = ("text", "parts", "image_ids")
+
     text: str
     parts: List[Tuple[str, Optional[str]]]
     image_ids: Set[str]
 
 
-def detect_media_type(data: bytes) -> Optional[str]:
+def detect_media_type(data: Union[bytes, bytearray, memoryview]) -> Optional[str]:
     """
     Detect image MIME type from magic bytes.
 
     Args:
-        data: Image bytes to analyze
+        data: Image bytes to analyze. A memoryview is inspected through a
+            12-byte copy of its head, never the whole buffer.
 
     Returns:
         MIME type string or None if not recognized
@@ -96,19 +136,59 @@ def detect_media_type(data: bytes) -> Optional[str]:
     if not data or len(data) < 12:
         return None
 
-    if data.startswith(b"\x89PNG\r\n\x1a\n"):
-        return "image/png"
-    elif data.startswith(b"\xff\xd8\xff"):
-        return "image/jpeg"
-    elif data.startswith(b"GIF87a") or data.startswith(b"GIF89a"):
-        return "image/gif"
-    elif data.startswith(b"RIFF") and b"WEBP" in data[8:12]:
-        return "image/webp"
-    elif data.startswith(b"BM"):
-        return "image/bmp"
-    else:
+    if isinstance(data, memoryview):
+        data = data[:12].tobytes()
+
+    first = data[0]
+    if first == 0x52:  # "R"
+        if data.startswith(b"RIFF") and data.startswith(b"WEBP", 8):
+            return "image/webp"
         return None
 
+    candidates = _FIRST_BYTE_TABLE[first]
+    if candidates:
+        for prefix, media_type in candidates:
+            if data.startswith(prefix):
+                return media_type
+    return None
+
+
+def detect_media_type_many(
+    blobs: Iterable[Union[bytes, bytearray, memoryview]],
+) -> List[Optional[str]]:
+    """
+    Detect MIME types for several images at once.
+
+    Args:
+        blobs: Image buffers to analyze
+
+    Returns:
+        List of MIME types (None where not recognized), in input order
+    """
+    return list(map(detect_media_type, blobs))
+
+
+def has_image_references(text: str) -> bool:
+    """
+    Check whether text contains any image placeholder.
+
+    Cheaper than parse_image_references() when only a yes/no answer is
+    needed; no parts or ID set are built.
+
+    Args:
+        text: Text that may contain {{image:img_xxx}} placeholders
+
+    Returns:
+        True if at least one valid placeholder is present
+
+    Example:
+        >>> has_image_references("Look at {{image:img_001}}")
+        True
+        >>> has_image_references("Just text")
+        False
+    """
+    return "{{image:" in text and _IMAGE_REF_PATTERN.search(text) is not None
+
 
 def parse_image_references(text: str) -> ParsedContent:
     """
@@ -131,28 +211,43 @@ def parse_image_references(text: str) -> ParsedContent:
         >>> result.image_ids
         {'img_001', 'img_002'}
     """
-    pattern = r"\{\{image:(\w+)\}\}"
-    parts: List[Tuple[str, Optional[str]]] = []
-    image_ids: Set[str] = set()
-    last_end = 0
+    # Most messages have no placeholders; skip the regex engine for them
+    if "{{image:" not in text:
+        return ParsedContent(text=text, parts=[(text, None)] if text else [], image_ids=set())
+
+    # Fresh mutable containers per call; the cached result is shared
+    parts, image_ids = _parse_cached(text)
+    return ParsedContent(text=text, parts=list(parts), image_ids=set(image_ids))
 
-    for match in re.finditer(pattern, text):
-        # Add text before this image reference
-        if match.start() > last_end:
-            parts.append((text[last_end : match.start()], None))
 
-        # Add image reference
-        image_id = match.group(1)
-        parts.append(("", image_id))
-        image_ids.add(image_id)
+# Only texts containing a placeholder reach this cache. It keeps strong
+# references to the last few such messages (which may hold large pasted
+# content), so it is deliberately small: enough for one backend to process
+# the current message several ways.
+@functools.lru_cache(maxsize=4)
+def _parse_cached(text: str) -> Tuple[Tuple[Tuple[str, Optional[str]], ...], FrozenSet[str]]:
+    """Parse text once for backends that render the same message several ways."""
+    parts = tuple(_iter_parts(text))
+    return parts, frozenset(image_id for _, image_id in parts if image_id)
+
+
+def _iter_parts(text: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield (content, image_id) parts of text without materializing them."""
+    last_end = 0
 
+    for match in _IMAGE_REF_PATTERN.finditer(text):
+        # Text before this image reference
+        start = match.start()
+        if start > last_end:
+            yield (text[last_end:start], None)
+
+        # Image reference
+        yield ("", match.group(1))
         last_end = match.end()
 
-    # Add remaining text
+    # Remaining text
     if last_end < len(text):
-        parts.append((text[last_end:], None))
-
-    return ParsedContent(text=text, parts=parts, image_ids=image_ids)
+        yield (text[last_end:], None)
 
 
 def iter_content_parts(
@@ -178,10 +273,9 @@ def iter_content_parts(
         ...     elif content:
         ...         process_text(content)
     """
-    parsed = parse_image_references(text)
-    images = images or {}
+    images = images or _EMPTY_IMAGES
 
-    for content, image_id in parsed.parts:
+    for content, image_id in _iter_parts(text):
         if image_id:
             # This is an image reference
             image_data = images.get(image_id)
@@ -217,10 +311,25 @@ def reconstruct_message(
         ...     return content
         >>> result = reconstruct_message(text, images, to_markdown)
     """
-    parts = []
-    for content, image in iter_content_parts(text, images):
-        parts.append(formatter(content, image))
-    return "".join(parts)
+    # Plain text is a single part; no scan or join needed
+    if "{{image:" not in text:
+        return formatter(text, None) if text else ""
+
+    images = images or _EMPTY_IMAGES
+    return "".join(
+        formatter("", images.get(image_id)) if image_id else formatter(content, None)
+        for content, image_id in _iter_parts(text)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pyclip():
+    """Import pyclip on first paste and keep the handle; None if unavailable."""
+    try:
+        import pyclip
+    except ImportError:
+        return None
+    return pyclip
 
 
 def create_paste_action(enable_by_default: bool = True):
@@ -236,13 +345,18 @@ def create_paste_action(enable_by_default: bool = True):
     Returns:
         Action instance for paste functionality
     """
-    from .actions import Action
 
     def paste_handler(context):
         """Paste image from clipboard into message."""
-        try:
-            import pyclip
+        repl = getattr(context, "repl", None)
+        buffer = getattr(context, "buffer", None)
+
+        pyclip = _load_pyclip()
+        if pyclip is None:
+            context.printer("Image paste requires 'pyclip' package: pip install pyclip")
+            return
 
+        try:
             # Try to get image data first
             img_bytes = pyclip.paste(text=False)
 
@@ -252,28 +366,26 @@ def create_paste_action(enable_by_default: bool = True):
 
                 if media_type is not None:
                     # Valid image - add to buffer and insert placeholder
-                    if not hasattr(context, "repl") or context.repl is None:
+                    if repl is None:
                         context.printer("Image paste not available in this context")
                         return
 
-                    image_id = context.repl.add_image(img_bytes, media_type)
+                    image_id = repl.add_image(img_bytes, media_type)
 
                     # Insert placeholder into prompt_toolkit buffer with space before
-                    if hasattr(context, "buffer") and context.buffer is not None:
+                    if buffer is not None:
                         placeholder = f" {{{{image:{image_id}}}}}"
-                        context.buffer.insert_text(placeholder)
+                        buffer.insert_text(placeholder)
                     return
 
             # Not an image or no binary data - try text paste instead
             text_data = pyclip.paste(text=True)
             if text_data:
-                if hasattr(context, "buffer") and context.buffer is not None:
-                    context.buffer.insert_text(text_data)
+                if buffer is not None:
+                    buffer.insert_text(text_data)
             else:
                 context.printer("No content in clipboard")
 
-        except ImportError:
-            context.printer("Image paste requires 'pyclip' package: pip install pyclip")
         except Exception as e:
             context.printer(f"Failed to paste: {e}")
 
@@ -5,15 +5,64 @@ Defines the interface contracts that backends and handlers must implement
 for compatibility with the REPL toolkit.
 """
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Protocol, runtime_checkable
+import abc
+import sys
+import weakref
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from .actions.action import ActionContext
     from .images import ImageData
 
 
+# Concrete types known to satisfy each protocol through their class alone.
+# Kept outside the protocol classes so they are not mistaken for members.
+_conforming_types: "weakref.WeakKeyDictionary[type, weakref.WeakSet]" = weakref.WeakKeyDictionary()
+
+# Python 3.12+ computes protocol members once per class; older versions
+# recompute them on every isinstance() call, so they are listed explicitly
+# in _PROTOCOL_MEMBERS at the end of this module.
+_STDLIB_CACHES_PROTOCOL_ATTRS = sys.version_info >= (3, 12)
+
+
+class _CachedProtocolMeta(type(Protocol)):  # type: ignore[misc]
+    """
+    Protocol metaclass that remembers which types pass isinstance() checks.
+
+    A runtime-checkable protocol re-derives its member list and probes each
+    member on every isinstance() call. Once a type is known to provide all
+    members on the class itself, the stdlib check always succeeds for its
+    instances, so later checks reduce to a set lookup. Negative results
+    depend on instance attributes and are never cached.
+    """
+
+    def __instancecheck__(cls, instance) -> bool:
+        known = _conforming_types.get(cls)
+        instance_type = type(instance)
+        if known is not None and instance_type in known:
+            return True
+
+        members = None if _STDLIB_CACHES_PROTOCOL_ATTRS else _PROTOCOL_MEMBERS.get(cls)
+        if members is None:
+            result = super().__instancecheck__(instance)
+        else:
+            # Same decision as the stdlib check, with the member set precomputed.
+            # All members are methods, so an attribute set to None opts out.
+            result = (
+                issubclass(instance.__class__, cls)
+                or all(getattr(instance, name, None) is not None for name in members)
+                or abc.ABCMeta.__instancecheck__(cls, instance)
+            )
+
+        if result and getattr(cls, "_is_protocol", False) and issubclass(instance_type, cls):
+            if known is None:
+                known = _conforming_types.setdefault(cls, weakref.WeakSet())
+            known.add(instance_type)
+        return result
+
+
 @runtime_checkable
-class AsyncBackend(Protocol):
+class AsyncBackend(Protocol, metaclass=_CachedProtocolMeta):
     """
     Protocol for async backends that process user input.
 
@@ -57,6 +106,17 @@ class CancellableBackend(AsyncBackend, Protocol):
            - False: Let handle_input() complete gracefully
         4. handle_input() should check the cancellation flag at safe checkpoints
         5. Reset the flag at the start of each new operation
+        6. If cancel messages are kept for logging, keep them in a bounded
+           buffer (e.g. collections.deque(maxlen=64)), not an ever-growing list
+
+    Checkpoint batching:
+        A checkpoint only needs to run often enough to bound cancellation
+        latency. For tight loops whose iterations take microseconds, check
+        every N iterations (e.g. ``if i % 64 == 0 and self._cancelled``) or
+        only before blocking calls, rather than on every iteration. The added
+        latency is at most N times the iteration time. Very quick work may not
+        need a checkpoint at all; pass the token down to the slow operations
+        you call instead.
 
     Backward Compatibility:
         - Backends without cancel() → task is force-cancelled
@@ -78,6 +138,33 @@ class CancellableBackend(AsyncBackend, Protocol):
             async def handle_input(self, user_input: str, **kwargs) -> bool:
                 # Process with agent - hooks handle cleanup on cancellation
                 return await self.agent.process(user_input)
+
+    Example (event-based checkpoints):
+        Waiting on an asyncio.Event instead of sleeping and then polling a
+        flag lets cancel() wake handle_input() immediately. The REPL calls
+        cancel() on the event loop thread; from another thread, use
+        loop.call_soon_threadsafe(event.set).
+
+        class EventBackend:
+            def __init__(self):
+                # Created in handle_input(): before Python 3.10 an Event binds
+                # to the loop current at construction, not the one awaiting it
+                self._cancel_event: Optional[asyncio.Event] = None
+
+            def cancel(self, message: Optional[str] = None) -> bool:
+                if self._cancel_event is not None:
+                    self._cancel_event.set()
+                return False
+
+            async def handle_input(self, user_input: str, **kwargs) -> bool:
+                cancel_event = self._cancel_event = asyncio.Event()
+                for step in self.steps:
+                    try:
+                        await asyncio.wait_for(cancel_event.wait(), step.delay)
+                        return False  # Cancelled
+                    except asyncio.TimeoutError:
+                        step.run()
+                return True
     """
 
     def cancel(self, message: Optional[str] = None) -> Optional[bool]:
@@ -102,7 +189,7 @@ class CancellableBackend(AsyncBackend, Protocol):
 
 
 @runtime_checkable
-class ActionHandler(Protocol):
+class ActionHandler(Protocol, metaclass=_CachedProtocolMeta):
     """
     Protocol for action handlers in the action system.
 
@@ -156,7 +243,7 @@ class ActionHandler(Protocol):
 
 
 @runtime_checkable
-class Completer(Protocol):
+class Completer(Protocol, metaclass=_CachedProtocolMeta):
     """
     Protocol for auto-completion providers.
 
@@ -176,3 +263,15 @@ class Completer(Protocol):
             Completion: Individual completion suggestions
         """
         ...
+
+
+# Members of each protocol, used by _CachedProtocolMeta before Python 3.12.
+# Keep in sync with the class bodies above.
+_PROTOCOL_MEMBERS: Dict[type, FrozenSet[str]] = {
+    AsyncBackend: frozenset({"handle_input"}),
+    CancellableBackend: frozenset({"handle_input", "cancel"}),
+    ActionHandler: frozenset(
+        {"execute_action", "handle_command", "validate_action", "list_actions"}
+    ),
+    Completer: frozenset({"get_completions"}),
+}
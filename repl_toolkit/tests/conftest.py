@@ -5,8 +5,9 @@ Pytest configuration and fixtures for repl-toolkit tests.
 import sys
 
 import pytest
-from prompt_toolkit.input import DummyInput
-from prompt_toolkit.output import DummyOutput
+
+# prompt_toolkit is imported inside the fixtures that need it, so collecting
+# or running tests that never touch the terminal does not load it.
 
 
 @pytest.fixture
@@ -22,42 +23,51 @@ def mock_terminal_for_repl(monkeypatch):
             # Terminal is now mocked
             repl = AsyncREPL()
     """
+    import prompt_toolkit.input.defaults as input_defaults
+    import prompt_toolkit.output.defaults as output_defaults
+    from prompt_toolkit.input import DummyInput
+    from prompt_toolkit.output import DummyOutput
 
-    # Mock prompt_toolkit's create_output to return DummyOutput
     def mock_create_output(*args, **kwargs):
         return DummyOutput()
 
-    # Mock prompt_toolkit's create_input to return DummyInput
     def mock_create_input(*args, **kwargs):
         return DummyInput()
 
-    # Patch the output creation functions
-    monkeypatch.setattr("prompt_toolkit.output.defaults.create_output", mock_create_output)
+    def skip_init(self, *args, **kwargs):
+        return None
 
-    # Patch the input creation functions
-    monkeypatch.setattr("prompt_toolkit.input.defaults.create_input", mock_create_input)
+    # Swap prompt_toolkit's terminal factories for dummy I/O
+    patches = [
+        (output_defaults, "create_output", mock_create_output),
+        (input_defaults, "create_input", mock_create_input),
+    ]
 
     # Also patch platform-specific output classes to prevent initialization errors
     if sys.platform == "win32":
-        # Mock Windows-specific components
-        monkeypatch.setattr(
-            "prompt_toolkit.output.windows10.Windows10_Output.__init__",
-            lambda self, *args, **kwargs: None,
-        )
-        monkeypatch.setattr(
-            "prompt_toolkit.output.win32.Win32Output.__init__", lambda self, *args, **kwargs: None
-        )
+        from prompt_toolkit.output.win32 import Win32Output
+        from prompt_toolkit.output.windows10 import Windows10_Output
+
+        patches.append((Windows10_Output, "__init__", skip_init))
+        patches.append((Win32Output, "__init__", skip_init))
+
+    for target, name, replacement in patches:
+        monkeypatch.setattr(target, name, replacement)
 
 
 @pytest.fixture
 def dummy_input():
     """Provide a DummyInput for tests that need to simulate input."""
+    from prompt_toolkit.input import DummyInput
+
     return DummyInput()
 
 
 @pytest.fixture
 def dummy_output():
     """Provide a DummyOutput for tests that need to capture output."""
+    from prompt_toolkit.output import DummyOutput
+
     return DummyOutput()
 
 
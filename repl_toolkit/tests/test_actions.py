@@ -14,6 +14,9 @@ from repl_toolkit.actions import (
     ActionValidationError,
 )
 
+# ActionContext only stores its registry, so a plain placeholder is enough
+_DUMMY_REGISTRY = object()
+
 
 class TestAction:
     """Test Action dataclass functionality."""
@@ -128,7 +131,7 @@ class TestActionContext:
 
     def test_context_creation(self):
         """Test action context creation."""
-        registry = Mock()
+        registry = _DUMMY_REGISTRY
         backend = Mock()
 
         context = ActionContext(
@@ -142,7 +145,7 @@ class TestActionContext:
 
     def test_context_triggered_by_detection(self):
         """Test automatic triggered_by detection."""
-        registry = Mock()
+        registry = _DUMMY_REGISTRY
 
         # Should detect shortcut from event
         context1 = ActionContext(registry=registry, event=Mock())
@@ -162,13 +165,13 @@ class TestActionContext:
 
     def test_context_printer_default(self):
         """Test that printer defaults to print."""
-        registry = Mock()
+        registry = _DUMMY_REGISTRY
         context = ActionContext(registry=registry)
         assert context.printer == print
 
     def test_context_custom_printer(self):
         """Test that custom printer can be set."""
-        registry = Mock()
+        registry = _DUMMY_REGISTRY
         custom_printer = Mock()
         context = ActionContext(registry=registry, printer=custom_printer)
         assert context.printer == custom_printer
@@ -378,6 +381,11 @@ class TestActionRegistry:
         self.registry.handle_command("/cmdtest arg1 arg2")
         assert executed == [["arg1", "arg2"]]
 
+        # Any whitespace separates the command and its arguments
+        self.registry.handle_command("/cmdtest\targ1  \n arg2")
+        self.registry.handle_command("cmdtest")
+        assert executed[1:] == [["arg1", "arg2"], []]
+
     def test_handle_command_with_custom_printer(self):
         """Test command handling with custom printer."""
         mock_printer = Mock()
@@ -502,6 +510,112 @@ class TestActionRegistry:
         calls = [str(call) for call in mock_printer.call_args_list]
         assert any("Available Actions" in str(call) for call in calls)
 
+    def test_general_help_printed_in_one_call(self):
+        """Test that general help is emitted as a single printer call."""
+        mock_printer = Mock()
+        registry = ActionRegistry(printer=mock_printer)
+
+        registry.handle_command("/help")
+
+        mock_printer.assert_called_once()
+        output = mock_printer.call_args[0][0]
+        assert output.startswith("\nAvailable Actions:\n")
+        assert "/shortcuts" in output
+
+    def test_help_line_uses_first_description_line(self):
+        """Test that general help shows only the first line of a description."""
+        registry = ActionRegistry()
+        action = Action(
+            name="multi",
+            description="Summary line\nLonger explanation",
+            category="Test",
+            handler=lambda ctx: None,
+            command="/multi",
+        )
+        registry.register_action(action)
+
+        line = registry._get_help_line(action)
+        assert line.endswith("Summary line")
+        assert "Longer explanation" not in line
+
+    def test_help_line_columns(self):
+        """Test the column layout of general help lines."""
+        registry = ActionRegistry()
+        action = Action(
+            name="cols",
+            description="Columns",
+            category="Test",
+            handler=lambda ctx: None,
+            command="/cols",
+            keys="F9",
+        )
+        keys_only = Action(
+            name="keys_only",
+            description="Keys only",
+            category="Test",
+            handler=lambda ctx: None,
+            keys="F8",
+        )
+
+        expected = "  " + "/cols".ljust(20) + "F9".ljust(15) + "Columns"
+        assert registry._get_help_line(action) == expected
+        assert registry._get_help_line(keys_only) == "  " + " " * 20 + "F8".ljust(15) + "Keys only"
+
+    def test_string_handler_resolved_once(self):
+        """Test that import-path handlers are imported once and cached."""
+        action = Action(
+            name="path_handler",
+            description="Handler given as import path",
+            category="Test",
+            handler="os.path.basename",
+            command="/basename",
+        )
+        self.registry.register_action(action)
+
+        import os.path
+
+        assert self.registry._resolve_handler(action) is os.path.basename
+        assert self.registry.handler_cache["os.path.basename"] is os.path.basename
+        assert self.registry._resolve_handler(action) is os.path.basename
+
+    def test_canon_adds_missing_slash(self):
+        """Test command normalization to the canonical '/command' form."""
+        assert ActionRegistry._canon("help") == "/help"
+        assert ActionRegistry._canon("/help") == "/help"
+        assert ActionRegistry._canon("") == "/"
+
+    def test_help_lines_cached_per_action(self):
+        """Test that general help lines are formatted once and reused."""
+        mock_printer = Mock()
+        registry = ActionRegistry(printer=mock_printer)
+
+        registry.handle_command("/help")
+        help_action = registry.get_action("show_help")
+        line = registry._help_line_cache["show_help"]
+        assert line == registry._get_help_line(help_action)
+        assert "/help" in line and "F1" in line
+
+        registry.handle_command("/help")
+        assert registry._help_line_cache["show_help"] is line
+
+    def test_sorted_categories_invalidated_on_register(self):
+        """Test that the sorted help grouping is rebuilt after registration."""
+        first = self.registry._get_sorted_categories()
+        assert self.registry._get_sorted_categories() is first
+
+        self.registry.register_action(
+            Action(
+                name="aaa_action",
+                description="Sorts first",
+                category="General",
+                handler=lambda ctx: None,
+                command="/aaa",
+            )
+        )
+
+        categories = dict(self.registry._get_sorted_categories())
+        assert categories["General"][0].name == "aaa_action"
+
     def test_builtin_shortcuts_action(self):
         """Test built-in shortcuts listing action."""
         context = ActionContext(registry=self.registry, args=[])
@@ -59,6 +59,11 @@ class TestAsyncREPL:
         # Should not raise error during initialization
         assert repl.session.history is not None
 
+    def test_invalid_prompt_string_rejected_at_init(self, mock_terminal_for_repl):
+        """Test that malformed prompt markup fails when the REPL is built."""
+        with pytest.raises(Exception):
+            AsyncREPL(prompt_string="<b>Custom: ")
+
     def test_key_parsing(self, mock_terminal_for_repl):
         """Test key combination parsing."""
         repl = AsyncREPL()
@@ -70,6 +75,7 @@ class TestAsyncREPL:
         # Test modifier combinations
         assert repl._parse_key_combination("ctrl-s") == ("c-s",)
         assert repl._parse_key_combination("alt-h") == ("escape", "h")
+        assert repl._parse_key_combination("Alt-Enter") == ("escape", "enter")
 
         # Test single keys
         assert repl._parse_key_combination("enter") == ("enter",)
@@ -83,6 +89,8 @@ class TestAsyncREPL:
         assert repl._is_exit_command("  /EXIT  ")
         assert not repl._is_exit_command("/help")
         assert not repl._is_exit_command("regular input")
+        assert not repl._is_exit_command("/exits")
+        assert repl._is_exit_command("/Quit\n")
 
     def test_backend_injection_during_run(self, mock_terminal_for_repl):
         """Test backend injection into action registry during run."""
@@ -251,6 +259,35 @@ class TestREPLActionIntegration:
         triggered_by, _ = self.executed_actions[0]
         assert triggered_by == "shortcut"
 
+    @pytest.mark.asyncio
+    async def test_command_scheduled_work_runs_before_next_prompt(self, mock_terminal_for_repl):
+        """Test that work a command schedules runs before the next input is read."""
+        scheduled = []
+
+        def scheduling_handler(context):
+            asyncio.get_running_loop().call_soon(scheduled.append, "done")
+
+        self.action_registry.register_action(
+            Action(
+                name="schedule",
+                description="Schedule work",
+                category="Test",
+                handler=scheduling_handler,
+                command="/schedule",
+            )
+        )
+        repl = AsyncREPL(action_registry=self.action_registry)
+        seen_at_prompt = []
+
+        async def fake_prompt():
+            seen_at_prompt.append(list(scheduled))
+            return "/schedule" if len(seen_at_prompt) == 1 else "/exit"
+
+        repl.session.prompt_async = fake_prompt
+        await repl.run(self.backend)
+
+        assert seen_at_prompt == [[], ["done"]]
+
 
 class TestErrorHandling:
     """Test error handling in AsyncREPL with late backend binding."""
@@ -379,3 +416,98 @@ class TestAsyncREPLEdgeCases:
 
         # Should have no bindings registered
         assert len(bindings.bindings) == 0
+
+
+class KwargsBackend(MockBackend):
+    """Mock backend accepting the kwargs passed by _process_input."""
+
+    def __init__(self):
+        super().__init__()
+        self.kwargs_received = []
+
+    async def handle_input(self, user_input: str, **kwargs) -> bool:
+        self.kwargs_received.append(kwargs)
+        return await super().handle_input(user_input)
+
+
+class TestProcessInput:
+    """Test the per-turn processing path of AsyncREPL."""
+
+    @pytest.mark.asyncio
+    async def test_process_input_calls_backend(self, mock_terminal_for_repl):
+        """Test that input reaches the backend and the turn completes."""
+        repl = AsyncREPL()
+        backend = KwargsBackend()
+
+        await repl._process_input("hello", backend)
+
+        assert backend.inputs_received == ["hello"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_app_reused_across_turns(self, mock_terminal_for_repl):
+        """Test that the cancel listener is built once and reused."""
+        repl = AsyncREPL()
+        backend = KwargsBackend()
+
+        await repl._process_input("first", backend)
+        cancel_app = repl._cancel_app
+        await repl._process_input("second", backend)
+
+        assert cancel_app is not None
+        assert repl._cancel_app is cancel_app
+        assert backend.inputs_received == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_callback_cancels_turn(self, mock_terminal_for_repl):
+        """Test that the backend's cancel_callback ends the turn early."""
+
+        class SelfCancellingBackend:
+            def __init__(self):
+                self.cancelled = False
+
+            async def handle_input(self, user_input: str, cancel_callback=None, **kwargs):
+                cancel_callback()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    self.cancelled = True
+                    raise
+                return True
+
+        repl = AsyncREPL()
+        backend = SelfCancellingBackend()
+
+        await asyncio.wait_for(repl._process_input("test", backend), timeout=5)
+
+        assert backend.cancelled
+
+    @pytest.mark.asyncio
+    async def test_stale_cancel_callback_ignored(self, mock_terminal_for_repl):
+        """Test that a callback kept from an earlier turn can't cancel a later one."""
+        repl = AsyncREPL()
+        backend = KwargsBackend()
+
+        await repl._process_input("first", backend)
+        stale_callback = backend.kwargs_received[0]["cancel_callback"]
+
+        class LateCancelBackend(KwargsBackend):
+            async def handle_input(self, user_input: str, **kwargs) -> bool:
+                stale_callback()
+                await asyncio.sleep(0.05)
+                return await super().handle_input(user_input, **kwargs)
+
+        late = LateCancelBackend()
+        await repl._process_input("second", late)
+
+        assert late.inputs_received == ["second"]
+
+    @pytest.mark.asyncio
+    async def test_no_tasks_outlive_turn(self, mock_terminal_for_repl):
+        """Test that the cancel-event waiter is cleaned up with the turn."""
+        repl = AsyncREPL()
+        backend = KwargsBackend()
+        before = asyncio.all_tasks()
+
+        await repl._process_input("hello", backend)
+
+        assert asyncio.all_tasks() == before
@@ -7,6 +7,7 @@ compatibility with backends that only implement AsyncBackend.
 """
 
 import asyncio
+from collections import deque
 from typing import Dict, Optional
 
 import pytest
@@ -20,12 +21,17 @@ class CancellableBackend:
 
     def __init__(self):
         self._cancel_requested = False
-        self.cancel_messages = []
+        # Created per operation so it belongs to the loop running handle_input()
+        self._cancel_event: Optional[asyncio.Event] = None
+        # Bounded so a copied template can't grow without limit in a long session
+        self.cancel_messages = deque(maxlen=64)
         self.operations_completed = 0
 
     def cancel(self, message: Optional[str] = None):
         """Signal cancellation."""
         self._cancel_requested = True
+        if self._cancel_event is not None:
+            self._cancel_event.set()
         self.cancel_messages.append(message)
 
     async def handle_input(
@@ -34,14 +40,17 @@ class CancellableBackend:
         """Process input with cancellation checkpoints."""
         # Reset flag at start
         self._cancel_requested = False
+        cancel_event = self._cancel_event = asyncio.Event()
 
         # Simulate long-running operation with checkpoints
         for i in range(10):
-            # Checkpoint: Check for cancellation at start of each iteration
-            if self._cancel_requested:
+            # Checkpoint: each simulated work step waits on the cancel event,
+            # so cancel() wakes the operation immediately
+            try:
+                await asyncio.wait_for(cancel_event.wait(), timeout=0.01)
                 return False  # Cancelled
-
-            await asyncio.sleep(0.01)  # Simulated work
+            except asyncio.TimeoutError:
+                pass  # Simulated work step finished
 
         self.operations_completed += 1
         return True
@@ -89,10 +98,10 @@ class TestBackendCancellation:
         backend = CancellableBackend()
 
         backend.cancel("First cancel")
-        assert backend.cancel_messages == ["First cancel"]
+        assert list(backend.cancel_messages) == ["First cancel"]
 
         backend.cancel("Second cancel")
-        assert backend.cancel_messages == ["First cancel", "Second cancel"]
+        assert list(backend.cancel_messages) == ["First cancel", "Second cancel"]
 
     def test_cancel_method_with_none_message(self):
         """Verify cancel() works with None message."""
@@ -100,7 +109,7 @@ class TestBackendCancellation:
 
         backend.cancel(None)
         assert backend._cancel_requested
-        assert backend.cancel_messages == [None]
+        assert list(backend.cancel_messages) == [None]
 
     @pytest.mark.asyncio
     async def test_handle_input_respects_cancellation(self):
@@ -170,7 +179,7 @@ class TestBackendCancellation:
             pytest.fail("Non-cancellable backend should not have cancel()")
 
         # Verify cancellable backend received the message
-        assert cancellable.cancel_messages == ["Test message"]
+        assert list(cancellable.cancel_messages) == ["Test message"]
 
     @pytest.mark.asyncio
     async def test_multiple_operations_reset_flag(self):
@@ -251,7 +260,7 @@ class TestHasattrPattern:
         if hasattr(backend, "cancel"):
             backend.cancel("Test cancellation")
 
-        assert backend.cancel_messages == ["Test cancellation"]
+        assert list(backend.cancel_messages) == ["Test cancellation"]
 
     def test_hasattr_pattern_with_non_cancellable_backend(self):
         """Verify hasattr pattern safely skips non-cancellable backend."""
@@ -148,6 +148,46 @@ class TestCtrlCCancellation:
         assert not backend.completed
 
 
+class TestCancelRequest:
+    """Test how cancel requests reach the turn in progress."""
+
+    class RecordingBackend:
+        def __init__(self):
+            self.messages = []
+
+        async def handle_input(self, user_input: str, **kwargs) -> bool:
+            await asyncio.sleep(10)
+            return True
+
+        def cancel(self, message=None):
+            self.messages.append(message)
+
+    @pytest.mark.asyncio
+    async def test_cancel_message(self, mock_terminal_for_repl):
+        """Test that backend.cancel() gets the standard cancellation message."""
+        repl = AsyncREPL()
+        backend = self.RecordingBackend()
+        task = asyncio.create_task(backend.handle_input("test"))
+
+        await repl._handle_cancellation(task, backend)
+
+        assert backend.messages == ["Operation cancelled by user"]
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_request_cancel_only_while_armed(self, mock_terminal_for_repl):
+        """Test that cancel requests outside a turn are ignored."""
+        repl = AsyncREPL()
+        cancel_event = repl._get_cancel_event()
+
+        repl._request_cancel()
+        assert not cancel_event.is_set()
+
+        repl._cancel_armed = True
+        repl._request_cancel()
+        assert cancel_event.is_set()
+
+
 class TestKeyBindingSimulation:
     """Test key binding behavior simulation."""
 
@@ -3,6 +3,8 @@ Tests for headless mode functionality with action framework support.
 """
 
 import asyncio
+import subprocess
+import sys
 from io import StringIO
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -69,6 +71,19 @@ class TestHeadlessREPL:
         repl._add_to_buffer("")
         assert repl.buffer == "Line 1\nLine 2\n"
 
+    def test_buffer_assignment(self):
+        """Test that assigning the buffer replaces accumulated content."""
+        repl = HeadlessREPL()
+        repl._add_to_buffer("Old content")
+
+        repl.buffer = "New"
+        repl._add_to_buffer("line")
+        assert repl.buffer == "New\nline"
+
+        repl.buffer = ""
+        repl._add_to_buffer("Fresh")
+        assert repl.buffer == "Fresh"
+
     @pytest.mark.asyncio
     async def test_execute_send_with_content(self):
         """Test /send execution with buffer content."""
@@ -110,14 +125,23 @@ class TestHeadlessREPL:
     @pytest.mark.asyncio
     async def test_execute_send_backend_exception(self):
         """Test /send execution with backend exception."""
-        backend = AsyncMock()
-        backend.handle_input.side_effect = Exception("Backend error")
+
+        class RaisingBackend:
+            def __init__(self):
+                self.inputs_received = []
+
+            async def handle_input(self, user_input: str) -> bool:
+                self.inputs_received.append(user_input)
+                raise Exception("Backend error")
+
+        backend = RaisingBackend()
 
         repl = HeadlessREPL()
         repl._add_to_buffer("Test content")
 
         await repl._execute_send(backend, "test")
 
+        assert backend.inputs_received == ["Test content"]
         assert repl.send_count == 1
         assert repl.buffer == ""  # Buffer cleared even on exception
         assert repl.total_success is False
@@ -180,6 +204,34 @@ class TestHeadlessREPL:
         assert command == "/status"
         assert kwargs["buffer"] == "Buffer content"
 
+    def test_execute_command_flushes_stdout(self):
+        """Test command output is flushed so piped consumers see it at once."""
+        repl = HeadlessREPL()
+        repl.action_registry.handle_command = lambda command, **kwargs: None
+
+        with patch("sys.stdout") as mock_stdout:
+            repl._execute_command("/status")
+
+        mock_stdout.flush.assert_called_once_with()
+
+    def test_execute_command_ignores_closed_stdout(self):
+        """Test a stdout that cannot be flushed does not break command handling."""
+        executed_commands = []
+
+        def mock_handle_command(command, **kwargs):
+            executed_commands.append(command)
+
+        repl = HeadlessREPL()
+        repl.action_registry.handle_command = mock_handle_command
+
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.flush.side_effect = ValueError("I/O operation on closed file")
+            repl._execute_command("/status")
+
+        assert executed_commands == ["/status"]
+        mock_stdout.flush.assert_called_once_with()
+        assert repl.running
+
     def test_execute_command_exception(self):
         """Test command execution with exception."""
 
@@ -233,6 +285,23 @@ class TestHeadlessREPL:
             assert self.backend.inputs_received == ["Initial message"]
             mock_stdin_loop.assert_called_once_with(self.backend)
 
+    @pytest.mark.asyncio
+    async def test_run_initial_message_exception_continues(self):
+        """Test that an initial message exception doesn't skip stdin processing."""
+
+        class RaisingBackend:
+            async def handle_input(self, user_input: str) -> bool:
+                raise RuntimeError("Backend error")
+
+        backend = RaisingBackend()
+        repl = HeadlessREPL()
+
+        with patch.object(repl, "_stdin_loop") as mock_stdin_loop:
+            result = await repl.run(backend, "Initial message")
+
+            assert result is False
+            mock_stdin_loop.assert_called_once_with(backend)
+
     @pytest.mark.asyncio
     async def test_run_exception_handling(self):
         """Test run with exception in stdin loop."""
@@ -424,6 +493,18 @@ class TestRunHeadlessMode:
             assert result is True
             mock_repl.run.assert_called_once_with(self.backend, None)
 
+    def test_headless_import_does_not_load_prompt_toolkit(self):
+        """Test that the headless entry point does not import prompt_toolkit."""
+        code = (
+            "import sys\n"
+            "from repl_toolkit import HeadlessREPL, run_headless_mode\n"
+            "assert 'prompt_toolkit' not in sys.modules, 'prompt_toolkit imported'\n"
+            "from repl_toolkit import AsyncREPL\n"
+            "assert 'prompt_toolkit' in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
 
 class TestActionIntegration:
     """Test integration with action system."""
@@ -5,6 +5,7 @@ import time
 from repl_toolkit import (
     ImageData,
     ParsedContent,
+    has_image_references,
     iter_content_parts,
     parse_image_references,
     reconstruct_message,
@@ -96,6 +97,44 @@ class TestParseImageReferences:
         assert len(result.parts) == 1
         assert result.parts[0][1] is None  # All treated as text
 
+    def test_repeated_parse_returns_independent_results(self):
+        """Test that cached parses don't share mutable state between callers."""
+        text = "Cached {{image:img_001}} text"
+
+        first = parse_image_references(text)
+        first.parts.append(("mutated", None))
+        first.image_ids.add("img_999")
+        second = parse_image_references(text)
+
+        assert second.parts == [("Cached ", None), ("", "img_001"), (" text", None)]
+        assert second.image_ids == {"img_001"}
+
+    def test_overlong_id_not_parsed(self):
+        """Test that IDs beyond the 64-character limit are left as text."""
+        longest = "a" * 64
+        assert parse_image_references(f"{{{{image:{longest}}}}}").image_ids == {longest}
+
+        result = parse_image_references(f"{{{{image:{'a' * 65}}}}}")
+        assert result.image_ids == set()
+        assert result.parts[0][1] is None
+
+
+class TestHasImageReferences:
+    """Test has_image_references utility."""
+
+    def test_detects_placeholder(self):
+        """Test that a valid placeholder is detected."""
+        assert has_image_references("Look at {{image:img_001}}")
+
+    def test_plain_text(self):
+        """Test text without any placeholder."""
+        assert not has_image_references("Just plain text")
+        assert not has_image_references("")
+
+    def test_malformed_placeholder(self):
+        """Test that the marker alone, without a valid ID, is not enough."""
+        assert not has_image_references("{{image:}} and {{image:bad-id}}")
+
 
 class TestIterContentParts:
     """Test iter_content_parts utility."""
@@ -175,6 +214,18 @@ class TestReconstructMessage:
         result = reconstruct_message("Hello world", None, formatter)
         assert result == "Hello world"
 
+    def test_text_only_formatter_applied(self):
+        """Test that plain text still goes through the formatter, once."""
+        calls = []
+
+        def formatter(content, image):
+            calls.append((content, image))
+            return content.upper()
+
+        assert reconstruct_message("hello", None, formatter) == "HELLO"
+        assert reconstruct_message("", None, formatter) == ""
+        assert calls == [("hello", None)]
+
     def test_with_image_to_text(self):
         """Test reconstruction replacing images with text."""
         img_data = ImageData(b"data", "image/png", time.time())
@@ -252,6 +303,21 @@ class TestReconstructMessage:
 
         assert result == "CHECK <img type='image/png' size=8 /> OUT"
 
+    def test_formatter_calls_match_iter_content_parts(self):
+        """Test that the formatter sees exactly the parts iter_content_parts yields."""
+        img_data = ImageData(b"data", "image/png", time.time())
+        images = {"img_001": img_data}
+        text = "{{image:img_001}}{{image:missing}} tail"
+        calls = []
+
+        def formatter(content, image):
+            calls.append((content, image))
+            return content
+
+        reconstruct_message(text, images, formatter)
+
+        assert calls == list(iter_content_parts(text, images))
+
 
 class TestParsedContentDataclass:
     """Test ParsedContent dataclass."""
@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from repl_toolkit import AsyncREPL, ImageData, detect_media_type
+from repl_toolkit import AsyncREPL, ImageData, detect_media_type, detect_media_type_many
 from repl_toolkit.actions import ActionContext, ActionRegistry
 from repl_toolkit.images import create_paste_action
 
@@ -56,6 +56,36 @@ class TestDetectMediaType:
         unknown_data = b"UNKNOWN" + b"\x00" * 10
         assert detect_media_type(unknown_data) is None
 
+    def test_detect_buffer_types(self):
+        """Test detection on bytearray and memoryview input."""
+        png_data = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+        assert detect_media_type(bytearray(png_data)) == "image/png"
+        assert detect_media_type(memoryview(png_data)) == "image/png"
+        assert detect_media_type(memoryview(png_data)[:5]) is None
+
+    def test_detect_many(self):
+        """Test batch detection keeps input order and unrecognized entries."""
+        blobs = [
+            b"\x89PNG\r\n\x1a\n" + b"\x00" * 10,
+            b"UNKNOWN" + b"\x00" * 10,
+            b"GIF89a" + b"\x00" * 10,
+        ]
+
+        assert detect_media_type_many(blobs) == ["image/png", None, "image/gif"]
+        assert detect_media_type_many(iter(blobs)) == [detect_media_type(b) for b in blobs]
+        assert detect_media_type_many([]) == []
+
+    def test_detect_riff_not_webp(self):
+        """Test that a non-WebP RIFF container is not recognized."""
+        wav_header = b"RIFF" + b"\x00" * 4 + b"WAVE" + b"\x00" * 10
+        assert detect_media_type(wav_header) is None
+
+    def test_detect_partial_signature(self):
+        """Test that a matching first byte alone is not enough."""
+        assert detect_media_type(b"\x89PNX" + b"\x00" * 10) is None
+        assert detect_media_type(b"GIF90a" + b"\x00" * 10) is None
+
 
 class TestImageData:
     """Test ImageData dataclass."""
@@ -71,6 +101,14 @@ class TestImageData:
         assert img_data.media_type == "image/png"
         assert img_data.timestamp == timestamp
 
+    def test_image_data_has_no_instance_dict(self):
+        """Test that ImageData uses slots instead of a per-instance dict."""
+        img_data = ImageData(data=b"", media_type="image/png", timestamp=0)
+
+        assert not hasattr(img_data, "__dict__")
+        with pytest.raises(AttributeError):
+            img_data.extra = 1
+
 
 class TestAsyncREPLImageSupport:
     """Test AsyncREPL image buffer management."""
@@ -148,6 +186,22 @@ class TestAsyncREPLImageSupport:
         images.clear()
         assert len(repl._image_buffer) == 1
 
+    def test_take_images_detaches_buffer(self, mock_terminal_for_repl):
+        """Test that a turn takes ownership of the buffered images."""
+        repl = AsyncREPL()
+
+        img_bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+        image_id = repl.add_image(img_bytes, "image/png")
+
+        images = repl._take_images()
+
+        assert image_id in images
+        assert len(repl._image_buffer) == 0
+
+        # Images pasted during the turn don't leak into the detached dict
+        repl.add_image(img_bytes, "image/png")
+        assert len(images) == 1
+
 
 class TestPasteImageAction:
     """Test paste action."""
@@ -304,6 +358,34 @@ class TestPasteImageAction:
         # Image should still be added to buffer
         assert len(repl._image_buffer) == 1
 
+    def test_image_ids_match_parsed_references(self, mock_terminal_for_repl):
+        """Test that parsed placeholder IDs look up the images add_image() stored."""
+        from repl_toolkit import parse_image_references
+
+        repl = AsyncREPL(enable_image_paste=True)
+        image_id = repl.add_image(b"\x89PNG\r\n\x1a\n" + b"\x00" * 10, "image/png")
+        text = "".join(["See {{image:", "img_", "001}} and {{image:img_001}}"])
+
+        parsed = parse_image_references(text)
+
+        assert [i for _, i in parsed.parts if i] == [image_id, image_id]
+        assert all(i in repl._image_buffer for i in parsed.image_ids)
+
+    def test_paste_without_pyclip(self, mock_terminal_for_repl):
+        """Test paste when pyclip cannot be imported."""
+        repl = AsyncREPL(enable_image_paste=True)
+        mock_printer = Mock()
+        context = ActionContext(
+            registry=repl.action_registry, repl=repl, printer=mock_printer, triggered_by="command"
+        )
+
+        with patch("repl_toolkit.images._load_pyclip", return_value=None):
+            repl.action_registry.execute_action("paste", context)
+
+        mock_printer.assert_called_once_with(
+            "Image paste requires 'pyclip' package: pip install pyclip"
+        )
+
 
 class TestBackendImageSupport:
     """Test backend integration with images."""
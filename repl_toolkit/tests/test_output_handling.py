@@ -78,6 +78,40 @@ class TestInteractiveModeOutput:
         # Verify print_formatted_text was called
         mock_print_formatted.assert_called_once_with("Test message")
 
+    @patch("repl_toolkit.async_repl.print_formatted_text")
+    def test_async_repl_coalesces_action_output(self, mock_print_formatted):
+        """Verify output printed by one action is written with a single call."""
+        repl = AsyncREPL()
+
+        def chatty_handler(context: ActionContext):
+            context.printer("first")
+            context.printer("second")
+            assert not mock_print_formatted.called
+
+        repl.action_registry.register_action(
+            Action(
+                name="chatty",
+                description="Prints twice",
+                category="Test",
+                handler=chatty_handler,
+                command="/chatty",
+            )
+        )
+
+        with repl._output_batch():
+            repl.action_registry.handle_command("/chatty")
+
+        mock_print_formatted.assert_called_once_with("first", "second", sep="\n")
+
+    def test_output_batch_is_noop_for_custom_printer(self):
+        """Verify a user-supplied printer is never deferred."""
+        output_buffer = []
+        repl = AsyncREPL(action_registry=ActionRegistry(printer=output_buffer.append))
+
+        with repl._output_batch():
+            repl.action_registry.printer("now")
+            assert output_buffer == ["now"]
+
     def test_action_context_has_prompt_toolkit_printer(self):
         """Verify ActionContext receives prompt_toolkit printer."""
         repl = AsyncREPL()
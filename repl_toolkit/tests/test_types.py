@@ -59,6 +59,79 @@ class TestProtocolCompliance:
         assert hasattr(completer, "get_completions")
 
 
+class TestProtocolInstanceCheckCache:
+    """Test the cached isinstance() path of the protocols."""
+
+    def test_repeated_checks_stay_correct(self):
+        """Test that cached positive results match the uncached answer."""
+        from repl_toolkit.ptypes import CancellableBackend
+
+        class Backend:
+            async def handle_input(self, user_input: str, **kwargs) -> bool:
+                return True
+
+            def cancel(self, message=None):
+                return None
+
+        class PlainBackend:
+            async def handle_input(self, user_input: str, **kwargs) -> bool:
+                return True
+
+        for _ in range(3):
+            assert isinstance(Backend(), CancellableBackend)
+            assert isinstance(Backend(), AsyncBackend)
+            assert not isinstance(PlainBackend(), CancellableBackend)
+
+    def test_instance_attributes_not_cached_by_type(self):
+        """Test that conformance via instance attributes is checked per instance."""
+
+        class Dynamic:
+            pass
+
+        with_method = Dynamic()
+        with_method.handle_input = AsyncMock(return_value=True)
+
+        assert isinstance(with_method, AsyncBackend)
+        assert not isinstance(Dynamic(), AsyncBackend)
+
+    def test_protocol_members_in_sync(self):
+        """Test that the precomputed member sets match the protocol definitions."""
+        import typing
+
+        from repl_toolkit.ptypes import _PROTOCOL_MEMBERS
+
+        for protocol, members in _PROTOCOL_MEMBERS.items():
+            expected = getattr(protocol, "__protocol_attrs__", None)
+            if expected is None:
+                expected = typing._get_protocol_attrs(protocol)
+            assert members == frozenset(expected), protocol.__name__
+
+    def test_matches_stdlib_instance_check(self):
+        """Test that the cached check agrees with the stdlib for varied objects."""
+        import typing
+
+        from repl_toolkit.ptypes import _PROTOCOL_MEMBERS
+
+        class Full:
+            async def handle_input(self, user_input: str, **kwargs) -> bool:
+                return True
+
+            def cancel(self, message=None):
+                return None
+
+        class OptedOut(Full):
+            cancel = None
+
+        class Empty:
+            pass
+
+        objects = [Full(), OptedOut(), Empty(), Mock(), object(), ActionRegistry()]
+        for protocol in _PROTOCOL_MEMBERS:
+            for obj in objects:
+                expected = typing._ProtocolMeta.__instancecheck__(protocol, obj)
+                assert isinstance(obj, protocol) == expected, (protocol.__name__, obj)
+
+
 class TestMockBackendCompliance:
     """Test mock backend implementations for protocol compliance."""
 